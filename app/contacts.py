@@ -37,6 +37,7 @@ def list_contacts(
     q: str | None = Query(None),
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -44,18 +45,23 @@ def list_contacts(
     Retrieve a list of contacts belonging to the current user.
 
     Supports optional text search by first name, last name, or email.
+    Pass ``after_id`` (the id of the last contact on the previous page)
+    for keyset pagination; ``skip`` remains for offset-based paging.
 
     Args:
         q (str | None): Optional search query.
         skip (int): Number of records to skip.
         limit (int): Maximum number of records to return.
+        after_id (int | None): Return contacts after this id.
         db (Session): Database session.
         current_user (User): Authenticated user.
 
     Returns:
-        list[ContactOut]: List of contacts.
+        list[ContactOut]: List of contacts ordered by id.
     """
-    return crud.get_contacts(db, user=current_user, skip=skip, limit=limit, q=q)
+    return crud.get_contacts(
+        db, user=current_user, skip=skip, limit=limit, q=q, after_id=after_id
+    )
 
 
 @router.get("/{contact_id}", response_model=schemas.ContactOut)
@@ -111,7 +117,7 @@ def patch_contact(
     c = crud.get_contact(db, contact_id, current_user)
     if not c:
         raise HTTPException(status_code=404, detail="Contact not found")
-    return crud.update_contact(db, c, changes.dict(exclude_unset=True))
+    return crud.update_contact(db, c, changes.model_dump(exclude_unset=True))
 
 
 @router.delete("/{contact_id}")
@@ -9,20 +9,27 @@ from functools import lru_cache
 from typing import List
 
 from fastapi_mail import ConnectionConfig
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables.
 
     Attributes:
+        ENV: Deployment environment ("dev", "test" or "prod").
         DATABASE_URL: Database connection string.
+        DB_POOL_SIZE: Number of persistent connections in the pool.
+        DB_MAX_OVERFLOW: Extra connections allowed beyond the pool size.
+        DB_POOL_RECYCLE: Seconds before a pooled connection is recycled.
         SECRET_KEY: Secret key used for JWT signing.
         ALGORITHM: Algorithm used to encode JWT tokens.
+        BCRYPT_ROUNDS: Work factor for bcrypt password hashing.
+        PASSWORD_SCHEME: Password hashing scheme ("bcrypt" or "argon2").
         ACCESS_TOKEN_EXPIRE_MINUTES: Access token lifetime in minutes.
         REFRESH_TOKEN_EXPIRE_MINUTES: Refresh token lifetime in minutes.
         ALLOWED_ORIGINS: Allowed origins for CORS.
         REDIS_URL: Redis connection URL for rate limiting and caching.
+        REDIS_MAX_CONNECTIONS: Upper bound of the Redis connection pool.
         CLOUDINARY_URL: Cloudinary connection URL for avatar uploads.
         SMTP_FROM_EMAIL: Sender email address for outgoing emails.
         SMTP_USER: SMTP username.
@@ -32,13 +39,20 @@ class Settings(BaseSettings):
         BASE_URL: Base URL of the application.
     """
 
+    ENV: str = "dev"
     DATABASE_URL: str = "sqlite:///./app.db"
+    DB_POOL_SIZE: int = 50
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
     SECRET_KEY: str = "dev-secret"
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_SCHEME: str = "bcrypt"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
     ALLOWED_ORIGINS: List[str] = ["*"]
     REDIS_URL: str = "redis://redis:6379"
+    REDIS_MAX_CONNECTIONS: int = 64
     CLOUDINARY_URL: str | None = None
     SMTP_FROM_EMAIL: str = "noreply@example.com"
     SMTP_USER: str = "user"
@@ -47,11 +61,7 @@ class Settings(BaseSettings):
     SMTP_HOST: str = "localhost"
     BASE_URL: str = "http://localhost:8000"
 
-    class Config:
-        """Pydantic configuration for loading environment variables."""
-
-        env_file = ".env"
-        extra = "allow"
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
 @lru_cache()
@@ -65,9 +75,13 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache(maxsize=1)
 def get_mail_config() -> ConnectionConfig:
     """Create and return email configuration for FastAPI-Mail.
 
+    The config is cached so the pydantic model is validated once per
+    process instead of on every outgoing email.
+
     Returns:
         ConnectionConfig: Configured email connection settings.
     """
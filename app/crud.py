@@ -4,14 +4,90 @@ This module contains database interaction logic for user and contact
 entities, isolated from FastAPI route handlers.
 """
 
+import time
+from collections import OrderedDict
 from datetime import date, timedelta
-from sqlalchemy import select, or_
-from sqlalchemy.orm import Session
+
+from sqlalchemy import exists, extract, lambda_stmt, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, make_transient_to_detached
 from fastapi import HTTPException, status
 
 from . import models, schemas
 
 
+def _insert_ignoring_conflict(
+    db: Session, model, values: dict, conflict_columns: list[str]
+):
+    """
+    Insert a row with ``ON CONFLICT DO NOTHING`` in one round-trip.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped model class to insert.
+        values (dict): Column values for the new row.
+        conflict_columns (list[str]): Columns of the unique constraint.
+
+    Returns:
+        Model instance from RETURNING, or ``None`` when the insert hit
+        an existing row.
+    """
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = (
+        insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=conflict_columns)
+        .returning(model)
+    )
+    return db.scalars(stmt).first()
+
+
+#: Short-lived LRU of user attribute snapshots keyed by email. The auth
+#: path resolves a user on every request; a 30-second window removes
+#: that SELECT for the common repeat case while writes invalidate their
+#: entry immediately.
+_USER_CACHE_TTL = 30
+_USER_CACHE_MAXSIZE = 1024
+_USER_CACHE_FIELDS = (
+    "id",
+    "email",
+    "hashed_password",
+    "is_verified",
+    "avatar_url",
+    "role",
+)
+_user_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+
+def _user_cache_put(user: models.User):
+    """Snapshot a user's column values into the lookup cache."""
+    snapshot = {field: getattr(user, field) for field in _USER_CACHE_FIELDS}
+    _user_cache[user.email] = (time.monotonic() + _USER_CACHE_TTL, snapshot)
+    _user_cache.move_to_end(user.email)
+    while len(_user_cache) > _USER_CACHE_MAXSIZE:
+        _user_cache.popitem(last=False)
+
+
+def _user_cache_get(email: str) -> dict | None:
+    """Return a cached attribute snapshot if present and fresh."""
+    entry = _user_cache.get(email)
+    if entry is None:
+        return None
+    expires_at, snapshot = entry
+    if time.monotonic() >= expires_at:
+        _user_cache.pop(email, None)
+        return None
+    _user_cache.move_to_end(email)
+    return snapshot
+
+
+def _user_cache_invalidate(email: str):
+    """Drop a user's cached snapshot after a mutation."""
+    _user_cache.pop(email, None)
+
+
 def create_user(
     db: Session, user_in: schemas.UserCreate, hashed_password: str
 ) -> models.User:
@@ -29,23 +105,23 @@ def create_user(
     Returns:
         User: Newly created user instance.
     """
-    existing = db.execute(
-        select(models.User).where(models.User.email == user_in.email)
-    ).scalar_one_or_none()
-    if existing:
+    user = _insert_ignoring_conflict(
+        db,
+        models.User,
+        {
+            "email": user_in.email,
+            "hashed_password": hashed_password,
+            "role": user_in.role,
+        },
+        ["email"],
+    )
+    if user is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already exists",
         )
-
-    user = models.User(
-        email=user_in.email,
-        hashed_password=hashed_password,
-        role=user_in.role,
-    )
-    db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -60,9 +136,45 @@ def get_user_by_email(db: Session, email: str) -> models.User | None:
     Returns:
         User | None: User if found, otherwise ``None``.
     """
-    return db.execute(
-        select(models.User).where(models.User.email == email)
-    ).scalar_one_or_none()
+    snapshot = _user_cache_get(email)
+    if snapshot is not None:
+        # Rebuild the instance from the snapshot and attach it to the
+        # session without emitting a SELECT.
+        cached = models.User(**snapshot)
+        make_transient_to_detached(cached)
+        return db.merge(cached, load=False)
+    # lambda_stmt: the expression tree and its compiled SQL are built
+    # once and reused; subsequent calls only swap the bound email.
+    stmt = lambda_stmt(
+        lambda: select(models.User).where(models.User.email == email)
+    )
+    user = db.execute(stmt).scalar_one_or_none()
+    if user is not None:
+        _user_cache_put(user)
+    return user
+
+
+def user_email_exists(db: Session, email: str) -> bool:
+    """
+    Check whether a user with the given email exists.
+
+    Issues ``SELECT 1 WHERE EXISTS(...)`` so the server stops at the
+    first matching row and returns a single integer — no row is
+    transferred or hydrated.
+
+    Args:
+        db (Session): Database session.
+        email (str): Email to check.
+
+    Returns:
+        bool: True if a user with the email exists.
+    """
+    return (
+        db.execute(
+            select(literal(1)).where(exists().where(models.User.email == email))
+        ).scalar()
+        is not None
+    )
 
 
 def get_user_by_id(db: Session, user_id: int) -> models.User | None:
@@ -76,9 +188,8 @@ def get_user_by_id(db: Session, user_id: int) -> models.User | None:
     Returns:
         User | None: User if found, otherwise ``None``.
     """
-    return db.execute(
-        select(models.User).where(models.User.id == user_id)
-    ).scalar_one_or_none()
+    stmt = lambda_stmt(lambda: select(models.User).where(models.User.id == user_id))
+    return db.execute(stmt).scalar_one_or_none()
 
 
 def verify_user(db: Session, user: models.User) -> models.User:
@@ -95,7 +206,9 @@ def verify_user(db: Session, user: models.User) -> models.User:
     user.is_verified = True
     db.add(user)
     db.commit()
-    db.refresh(user)
+    # No refresh: the flag is assigned in Python and nothing else on the
+    # row is server-generated.
+    _user_cache_invalidate(user.email)
     return user
 
 
@@ -111,11 +224,14 @@ def update_user_avatar(db: Session, user: models.User, avatar_url: str) -> model
     Returns:
         User: Updated user instance.
     """
-    target = get_user_by_id(db, user.id) or user
+    # Load the live row (identity-map hit when already in the session)
+    # and touch only the changed column: ``user`` may be a cache-built
+    # snapshot, and merging it wholesale would write stale attributes
+    # back over the database.
+    target = db.get(models.User, user.id)
     target.avatar_url = avatar_url
-    db.add(target)
     db.commit()
-    db.refresh(target)
+    _user_cache_invalidate(target.email)
     return target
 
 
@@ -133,11 +249,10 @@ def update_user_password(
     Returns:
         User: Updated user instance.
     """
-    target = get_user_by_id(db, user.id) or user
+    target = db.get(models.User, user.id)
     target.hashed_password = hashed_password
-    db.add(target)
     db.commit()
-    db.refresh(target)
+    _user_cache_invalidate(target.email)
     return target
 
 
@@ -158,23 +273,19 @@ def create_contact(
     Returns:
         Contact: Newly created contact.
     """
-    existing = db.execute(
-        select(models.Contact).where(
-            models.Contact.owner_id == user.id,
-            models.Contact.email == contact_in.email,
-        )
-    ).scalar_one_or_none()
-
-    if existing:
+    contact = _insert_ignoring_conflict(
+        db,
+        models.Contact,
+        {**contact_in.model_dump(), "owner_id": user.id},
+        ["owner_id", "email"],
+    )
+    if contact is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Contact already exists",
         )
-
-    contact = models.Contact(**contact_in.dict(), owner_id=user.id)
-    db.add(contact)
     db.commit()
-    db.refresh(contact)
     return contact
 
 
@@ -190,12 +301,17 @@ def get_contact(db: Session, contact_id: int, user: models.User):
     Returns:
         Contact | None: Contact if found, otherwise ``None``.
     """
-    return db.execute(
-        select(models.Contact).where(
+    # Pull the id into a plain local: lambda closure analysis tracks
+    # simple variables as bind parameters but rejects attribute access
+    # on ORM instances.
+    owner_id = user.id
+    stmt = lambda_stmt(
+        lambda: select(models.Contact).where(
             models.Contact.id == contact_id,
-            models.Contact.owner_id == user.id,
+            models.Contact.owner_id == owner_id,
         )
-    ).scalar_one_or_none()
+    )
+    return db.execute(stmt).scalar_one_or_none()
 
 
 def get_contacts(
@@ -204,45 +320,54 @@ def get_contacts(
     skip: int = 0,
     limit: int = 100,
     q: str | None = None,
+    after_id: int | None = None,
 ):
     """
     Retrieve a list of contacts for the given user.
 
-    Supports optional case-insensitive search by name or email.
+    Supports optional case-insensitive search by name or email. When
+    ``after_id`` is given, pagination is keyset-based: the page starts
+    after that contact id, which stays an indexed seek regardless of
+    page depth, unlike OFFSET which scans and discards skipped rows.
 
     Args:
         db (Session): Database session.
         user (User): Contact owner.
-        skip (int): Number of records to skip.
+        skip (int): Number of records to skip (ignored with after_id).
         limit (int): Maximum number of records to return.
         q (str | None): Optional search query.
+        after_id (int | None): Return contacts with ids greater than
+            this value.
 
     Returns:
-        list[Contact]: List of contacts.
+        list[Contact]: List of contacts ordered by id.
     """
     stmt = (
         select(models.Contact)
         .where(models.Contact.owner_id == user.id)
-        .offset(skip)
+        .order_by(models.Contact.id)
         .limit(limit)
     )
 
     if q:
-        like_q = f"%{q}%"
-        stmt = (
-            select(models.Contact)
-            .where(
-                models.Contact.owner_id == user.id,
-                or_(
-                    models.Contact.first_name.ilike(like_q),
-                    models.Contact.last_name.ilike(like_q),
-                    models.Contact.email.ilike(like_q),
-                ),
+        # Lower the pattern once in Python; on non-Postgres dialects
+        # ilike() compiles to lower(col) LIKE lower(:pattern), which the
+        # functional lower() indexes can serve, while Postgres keeps the
+        # raw-column ILIKE that the trigram indexes cover.
+        like_q = f"%{q.lower()}%"
+        stmt = stmt.where(
+            or_(
+                models.Contact.first_name.ilike(like_q),
+                models.Contact.last_name.ilike(like_q),
+                models.Contact.email.ilike(like_q),
             )
-            .offset(skip)
-            .limit(limit)
         )
 
+    if after_id is not None:
+        stmt = stmt.where(models.Contact.id > after_id)
+    elif skip:
+        stmt = stmt.offset(skip)
+
     return db.scalars(stmt).all()
 
 
@@ -263,7 +388,8 @@ def update_contact(db: Session, contact: models.Contact, changes: dict):
 
     db.add(contact)
     db.commit()
-    db.refresh(contact)
+    # No refresh: ``changes`` is authoritative and the remaining
+    # attributes were loaded when the contact was fetched.
     return contact
 
 
@@ -284,6 +410,11 @@ def get_upcoming_birthdays(db: Session, user: models.User, days: int = 7):
     """
     Retrieve contacts with birthdays occurring within the next N days.
 
+    The month/day window is evaluated inside the database, so only
+    matching rows are transferred and hydrated instead of every contact
+    the user owns. Year wrap-around (e.g. late December into January)
+    is handled by splitting the window into two ranges.
+
     Args:
         db (Session): Database session.
         user (User): Contact owner.
@@ -295,17 +426,21 @@ def get_upcoming_birthdays(db: Session, user: models.User, days: int = 7):
     today = date.today()
     end = today + timedelta(days=days)
 
-    contacts = db.scalars(
-        select(models.Contact).where(models.Contact.owner_id == user.id)
-    ).all()
-
-    result = []
-    for contact in contacts:
-        if not contact.birthday:
-            continue
-
-        birthday_this_year = contact.birthday.replace(year=today.year)
-        if today <= birthday_this_year <= end:
-            result.append(contact)
-
-    return result
+    # Encode month and day as a single comparable MMDD integer.
+    mmdd = extract("month", models.Contact.birthday) * 100 + extract(
+        "day", models.Contact.birthday
+    )
+    start_key = today.month * 100 + today.day
+    end_key = end.month * 100 + end.day
+
+    if start_key <= end_key:
+        window = mmdd.between(start_key, end_key)
+    else:
+        window = or_(mmdd >= start_key, mmdd <= end_key)
+
+    stmt = select(models.Contact).where(
+        models.Contact.owner_id == user.id,
+        models.Contact.birthday.isnot(None),
+        window,
+    )
+    return db.scalars(stmt).all()
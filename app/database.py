@@ -14,10 +14,17 @@ from .core import get_settings
 settings = get_settings()
 
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    future=True,
-)
+_engine_kwargs = {"future": True, "pool_pre_ping": True}
+if not settings.DATABASE_URL.startswith("sqlite"):
+    # SQLite uses its own single-connection pooling; sizing only applies
+    # to server databases such as Postgres.
+    _engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+engine = create_engine(settings.DATABASE_URL, **_engine_kwargs)
 """SQLAlchemy engine bound to the configured database URL."""
 
 
@@ -25,6 +32,11 @@ SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
     autocommit=False,
+    # Committed instances keep their loaded attributes instead of being
+    # expired, so serializing a response after commit does not re-SELECT
+    # the row. Sessions are request-scoped, so staleness is bounded by
+    # the request.
+    expire_on_commit=False,
     future=True,
 )
 """Factory for database sessions."""
@@ -39,12 +51,17 @@ def get_db():
     Provide a SQLAlchemy database session.
 
     This function is used as a FastAPI dependency.
-    It yields a database session and ensures it is
-    properly closed after the request is completed.
+    It yields a database session, rolls back uncommitted state if the
+    request raised, and expunges loaded instances before closing so the
+    identity map does not keep reference cycles alive between requests.
     """
 
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
+        db.expunge_all()
         db.close()
@@ -10,7 +10,10 @@ from sqlalchemy import (
     Date,
     Boolean,
     ForeignKey,
+    Index,
     UniqueConstraint,
+    extract,
+    func,
 )
 from sqlalchemy.orm import relationship
 
@@ -34,7 +37,9 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)
     role = Column(String(20), default="user", nullable=False)
 
-    #: List of contacts owned by the user
+    #: List of contacts owned by the user. Loaded lazily; callers that
+    #: iterate the collection for many users should add a
+    #: ``selectinload(User.contacts)`` option to their query.
     contacts = relationship(
         "Contact",
         back_populates="owner",
@@ -51,7 +56,35 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
-    __table_args__ = (UniqueConstraint("owner_id", "email", name="uq_owner_email"),)
+    __table_args__ = (
+        # The unique constraint's backing index also serves
+        # (owner_id, email) lookups, so no separate index is needed.
+        UniqueConstraint("owner_id", "email", name="uq_owner_email"),
+        # Composite index so keyset pagination per owner is a single
+        # index scan instead of bitmap-AND plus recheck.
+        Index("ix_contacts_owner_id_id", "owner_id", "id"),
+        # Trigram indexes let Postgres serve the leading-wildcard ILIKE
+        # search from an index instead of a sequential scan. Other
+        # dialects ignore the GIN options and create plain indexes.
+        Index(
+            "ix_contacts_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(100), nullable=False, index=True)
@@ -70,3 +103,18 @@ class Contact(Base):
 
     #: Reference to the owning User object
     owner = relationship("User", back_populates="contacts")
+
+
+#: Functional index over the MMDD key used by the upcoming-birthday
+#: query, so the window filter is an index range scan.
+Index(
+    "ix_contacts_bday_mmdd",
+    extract("month", Contact.birthday) * 100 + extract("day", Contact.birthday),
+)
+
+#: Functional lower() indexes for the case-insensitive search on
+#: dialects without pg_trgm (SQLite, MySQL), where ilike() compiles to
+#: lower(col) LIKE lower(pattern) and can use these for prefix matches.
+Index("ix_contacts_first_name_lower", func.lower(Contact.first_name))
+Index("ix_contacts_last_name_lower", func.lower(Contact.last_name))
+Index("ix_contacts_email_lower", func.lower(Contact.email))
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 
 
@@ -36,8 +36,7 @@ class ContactOut(ContactBase):
 
     id: int
 
-    class Config:
-        orm_mode = True  # allow SQLAlchemy objects
+    model_config = ConfigDict(from_attributes=True)  # allow SQLAlchemy objects
 
 
 class UserBase(BaseModel):
@@ -61,8 +60,7 @@ class UserOut(UserBase):
     avatar_url: Optional[str] = None
     role: str = "user"
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
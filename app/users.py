@@ -1,12 +1,14 @@
 """User-related routes and operations for the Contacts API."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 from fastapi_limiter.depends import RateLimiter
 from sqlalchemy.orm import Session
 import cloudinary
 import cloudinary.uploader
 
-from .auth import get_current_user
+from .auth import cache_user, get_current_user
 from .database import get_db
 from . import schemas, crud
 from .core import get_settings
@@ -14,7 +16,11 @@ from .core import get_settings
 router = APIRouter(prefix="/users", tags=["users"])
 settings = get_settings()
 
-if settings.CLOUDINARY_URL:
+#: Resolved once at import; the avatar handler checks this plain boolean
+#: instead of re-reading settings attributes on every request.
+CLOUDINARY_ENABLED = bool(settings.CLOUDINARY_URL)
+
+if CLOUDINARY_ENABLED:
     cloudinary.config(cloudinary_url=settings.CLOUDINARY_URL)
 
 
@@ -37,7 +43,7 @@ def read_me(current_user=Depends(get_current_user)):
 
 
 @router.put("/avatar", response_model=schemas.UserOut)
-def update_avatar(
+async def update_avatar(
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -66,13 +72,17 @@ def update_avatar(
             detail="Only administrators can change avatars",
         )
 
-    if not settings.CLOUDINARY_URL:
+    if not CLOUDINARY_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Cloudinary is not configured",
         )
 
-    upload_result = cloudinary.uploader.upload(file.file, folder="contacts_avatars")
+    # The upload is blocking network I/O; run it in a worker thread so
+    # the event loop keeps serving other requests meanwhile.
+    upload_result = await asyncio.to_thread(
+        cloudinary.uploader.upload, file.file, folder="contacts_avatars"
+    )
     avatar_url = upload_result.get("secure_url")
 
     if not avatar_url:
@@ -82,4 +92,7 @@ def update_avatar(
         )
 
     user = crud.update_user_avatar(db, current_user, avatar_url)
+    # Re-cache so the auth cache (which get_cached_user keeps alive with
+    # TTL refreshes) serves the new avatar instead of the stale entry.
+    await cache_user(user)
     return user
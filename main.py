@@ -21,6 +21,7 @@ Modules:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_limiter import FastAPILimiter
 import redis.asyncio as redis
 
@@ -64,17 +65,21 @@ except Exception:  # pragma: no cover - fallback for offline environments
 
 from app.database import engine
 from app import models, contacts
+from app.auth import get_cache_client
 from app.auth import router as auth_router
 from app.users import router as users_router
 from app.core import get_settings
 
-# Create tables (for development only)
-models.Base.metadata.create_all(bind=engine)
-
 settings = get_settings()
 
-# Initialize FastAPI application
-app = FastAPI(title="Contacts API")
+# Create tables in dev/test only; production schema is managed by
+# Alembic migrations, and the startup metadata reflection is skipped.
+if settings.ENV in {"dev", "test"}:
+    models.Base.metadata.create_all(bind=engine)
+
+# Initialize FastAPI application; orjson serializes response bodies
+# several times faster than the stdlib json encoder
+app = FastAPI(title="Contacts API", default_response_class=ORJSONResponse)
 
 # Configure CORS middleware
 app.add_middleware(
@@ -91,8 +96,10 @@ async def startup_event():
     """
     FastAPI startup event handler.
 
-    Initializes the rate limiter with Redis backend. Falls back to
-    FakeRedis if Redis is unavailable (e.g., during tests or offline).
+    Initializes the rate limiter with Redis backend and warms up the
+    user-cache client so its connection pool is checked before the first
+    request. Falls back to FakeRedis if Redis is unavailable (e.g.,
+    during tests or offline).
     """
     redis_client = redis.from_url(
         settings.REDIS_URL, encoding="utf-8", decode_responses=True
@@ -101,6 +108,7 @@ async def startup_event():
         await FastAPILimiter.init(redis_client)
     except Exception:
         await FastAPILimiter.init(FakeRedis())
+    await get_cache_client()
 
 
 # Include routers for application areas
@@ -2,6 +2,7 @@
 import os
 import sys
 import asyncio
+import functools
 import json
 from urllib.parse import urlencode
 
@@ -14,12 +15,30 @@ sys.path.append(os.path.abspath("."))
 
 from fastapi_limiter import FastAPILimiter
 
+from app import auth, crud, models
+from app.auth import create_access_token, get_password_hash
 from app.database import Base, get_db
 from app.core import get_settings
-from app import models
 from main import app
 
 
+@functools.lru_cache(maxsize=None)
+def login_form_body(email: str, password: str = "secret123") -> bytes:
+    """Return the urlencoded login form for a principal, encoded once."""
+    return urlencode({"username": email, "password": password}).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def cached_password_hash(password: str) -> str:
+    """Hash a test password once per process.
+
+    The suite reuses a handful of constant passwords; bcrypt's key
+    schedule is deliberately slow, so every helper should go through
+    this cache instead of calling get_password_hash directly.
+    """
+    return get_password_hash(password)
+
+
 # DB (SQLite in-memory for tests)
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
@@ -28,7 +47,11 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False matches the app session factory: committed
+# fixture objects keep their attributes without a re-SELECT per access.
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -38,13 +61,22 @@ def prepare_database():
     Base.metadata.drop_all(bind=engine)
 
 
+# Each test runs inside an outer transaction on a dedicated connection;
+# session.commit() only releases SAVEPOINTs, and the teardown rollback
+# discards everything the test wrote without re-seeding the schema.
 @pytest.fixture()
 def db_session():
-    session = TestingSessionLocal()
+    connection = engine.connect()
+    trans = connection.begin()
+    session = TestingSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
     try:
         yield session
     finally:
         session.close()
+        trans.rollback()
+        connection.close()
 
 
 # One event loop for the WHOLE pytest session
@@ -89,6 +121,45 @@ def adjust_settings_env():
     return settings
 
 
+# Tests only need a valid Bearer token, not the login flow itself, so
+# tokens are minted directly with create_access_token and memoized per
+# email. The login endpoint keeps its own dedicated coverage in
+# test_auth.
+@pytest.fixture(scope="session")
+def token_for():
+    @functools.lru_cache(maxsize=None)
+    def mint(email):
+        return create_access_token({"sub": email})
+
+    return mint
+
+
+# Session-scoped user setup: the database outlives individual tests, so
+# a user created once is simply looked up on later requests instead of
+# paying the hash/INSERT/commit cost again.
+@pytest.fixture(scope="session")
+def verified_user_factory():
+    def factory(db_session, email, password="secret123", role="user"):
+        existing = (
+            db_session.query(models.User).filter_by(email=email).first()
+        )
+        if existing is not None:
+            return existing
+        # Build the row verified from the start: one INSERT and one
+        # commit instead of create-then-flip-the-flag with two commits.
+        user = models.User(
+            email=email,
+            hashed_password=cached_password_hash(password),
+            is_verified=True,
+            role=role,
+        )
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    return factory
+
+
 # Simple ASGI response/client
 class SimpleResponse:
     def __init__(
@@ -102,6 +173,19 @@ class SimpleResponse:
         return json.loads(self._body.decode())
 
 
+# Multipart framing precomputed once: per-part work is a single %-format
+# with pre-encoded bytes instead of rebuilding f-strings and encoding
+# them for every upload.
+MULTIPART_BOUNDARY = b"TESTBOUNDARY"
+MULTIPART_CONTENT_TYPE = f"multipart/form-data; boundary={MULTIPART_BOUNDARY.decode()}"
+_PART_HEADER_TMPL = (
+    b"--" + MULTIPART_BOUNDARY + b"\r\n"
+    b'Content-Disposition: form-data; name="%b"; filename="%b"\r\n'
+    b"Content-Type: %b\r\n\r\n"
+)
+_MULTIPART_FOOTER = b"--" + MULTIPART_BOUNDARY + b"--\r\n"
+
+
 class SimpleClient:
     """
     Important:
@@ -131,19 +215,18 @@ class SimpleClient:
         body_bytes = b""
 
         if files:
-            boundary = "TESTBOUNDARY"
-            parts: list[bytes] = []
+            buf = bytearray()
             for name, (filename, content, content_type) in files.items():
-                disposition = f'form-data; name="{name}"; filename="{filename}"'
-                part_headers = (
-                    f"--{boundary}\r\n"
-                    f"Content-Disposition: {disposition}\r\n"
-                    f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+                buf += _PART_HEADER_TMPL % (
+                    name.encode(),
+                    filename.encode(),
+                    (content_type or "application/octet-stream").encode(),
                 )
-                parts.append(part_headers.encode() + content + b"\r\n")
-            parts.append(f"--{boundary}--\r\n".encode())
-            body_bytes = b"".join(parts)
-            headers["content-type"] = f"multipart/form-data; boundary={boundary}"
+                buf += content
+                buf += b"\r\n"
+            buf += _MULTIPART_FOOTER
+            body_bytes = bytes(buf)
+            headers["content-type"] = MULTIPART_CONTENT_TYPE
 
         elif json_body is not None:
             body_bytes = json.dumps(json_body).encode()
@@ -204,17 +287,44 @@ class SimpleClient:
         )
 
 
-# Client fixture: override DB dependency per test
-@pytest.fixture()
-def client(db_session, session_loop):
+# One client for the whole session; it holds no per-test state, so
+# there is nothing to rebuild between tests.
+@pytest.fixture(scope="session")
+def client(session_loop):
+    c = SimpleClient(app, loop=session_loop)
+    try:
+        yield c
+    finally:
+        c.close()
+
+
+# The SAVEPOINT rollback isolates the database but not the app's
+# process-global caches; clear them after each test so no one is served
+# a user rebuilt from another test's rolled-back rows.
+@pytest.fixture(autouse=True)
+def reset_app_caches():
+    yield
+    crud._user_cache.clear()
+    auth._verify_cache.clear()
+    auth._jwt_cache.clear()
+    if isinstance(auth._cache_client, auth.MemoryCache):
+        auth._cache_client.store.clear()
+    else:
+        # A real Redis client keeps state outside the process; drop the
+        # handle so the next test re-initializes from scratch.
+        auth._cache_client = None
+
+
+# Per-test isolation lives in the dependency override, not the client:
+# every request made during a test hits that test's transactional
+# session.
+@pytest.fixture(autouse=True)
+def override_db(db_session):
     def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
-
-    c = SimpleClient(app, loop=session_loop)
     try:
-        yield c
+        yield
     finally:
         app.dependency_overrides.clear()
-        c.close()
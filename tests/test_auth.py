@@ -1,14 +1,13 @@
 from fastapi import status
 
-from app import crud
 from app.auth import (
     create_access_token,
     create_password_reset_token,
     get_password_hash,
     verify_password,
 )
-from app.schemas import UserCreate
 from app.models import User
+from conftest import cached_password_hash, login_form_body
 
 
 def test_password_hashing_roundtrip():
@@ -21,13 +20,14 @@ def test_password_hashing_roundtrip():
 def create_verified_user(
     db_session, email="user@example.com", password="secret123", role="user"
 ):
-    hashed = get_password_hash(password)
-    user_in = UserCreate(email=email, password=password, role=role)
-    user = crud.create_user(db_session, user_in, hashed)
-    user.is_verified = True
+    user = User(
+        email=email,
+        hashed_password=cached_password_hash(password),
+        is_verified=True,
+        role=role,
+    )
     db_session.add(user)
     db_session.commit()
-    db_session.refresh(user)
     return user
 
 
@@ -35,7 +35,7 @@ def test_login_and_token_pair(client, db_session):
     create_verified_user(db_session)
     response = client.post(
         "/auth/login",
-        data={"username": "user@example.com", "password": "secret123"},
+        data=login_form_body("user@example.com"),
         headers={"content-type": "application/x-www-form-urlencoded"},
     )
     assert response.status_code == status.HTTP_200_OK
@@ -54,7 +54,7 @@ def test_refresh_token_returns_new_access(client, db_session):
     create_verified_user(db_session, email="refresh@example.com")
     login_resp = client.post(
         "/auth/login",
-        data={"username": "refresh@example.com", "password": "secret123"},
+        data=login_form_body("refresh@example.com"),
         headers={"content-type": "application/x-www-form-urlencoded"},
     ).json()
     refresh_resp = client.post(
@@ -2,37 +2,18 @@ from datetime import date, timedelta
 
 from fastapi import status
 
-from app import crud
-from app.auth import get_password_hash
-from app.schemas import UserCreate, ContactCreate
+from app.models import Contact
 
+#: Birthday inside the default 7-day window, computed once per module
+#: instead of per test case.
+_UPCOMING = date.today() + timedelta(days=3)
 
-def create_verified_user(
-    db_session, email="owner@example.com", password="secret123", role="user"
-):
-    hashed = get_password_hash(password)
-    user_in = UserCreate(email=email, password=password, role=role)
-    user = crud.create_user(db_session, user_in, hashed)
-    user.is_verified = True
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
-
-
-def login(client, email, password):
-    response = client.post(
-        "/auth/login",
-        data={"username": email, "password": password},
-        headers={"content-type": "application/x-www-form-urlencoded"},
-    )
-    assert response.status_code == status.HTTP_200_OK
-    return response.json()["access_token"]
 
-
-def test_create_and_list_contacts(client, db_session):
-    user = create_verified_user(db_session, email="contacts@example.com")
-    token = login(client, user.email, "secret123")
+def test_create_and_list_contacts(
+    client, db_session, verified_user_factory, token_for
+):
+    user = verified_user_factory(db_session, email="contacts@example.com")
+    token = token_for(user.email)
 
     new_contact = {
         "first_name": "John",
@@ -55,22 +36,28 @@ def test_create_and_list_contacts(client, db_session):
     assert len(list_resp.json()) == 1
 
 
-def test_upcoming_birthdays(client, db_session):
-    user = create_verified_user(db_session, email="birthday@example.com")
-    token = login(client, user.email, "secret123")
-    birthday_date = date.today() + timedelta(days=3)
-    contact = ContactCreate(
-        first_name="Jane",
-        last_name="Smith",
-        email="jane@example.com",
-        birthday=birthday_date,
+def test_upcoming_birthdays(
+    client, db_session, verified_user_factory, token_for
+):
+    user = verified_user_factory(db_session, email="birthday@example.com")
+    token = token_for(user.email)
+    # Fixture state only: a Core insert skips ORM instance construction
+    # and identity-map bookkeeping for a row the test never reads back.
+    db_session.execute(
+        Contact.__table__.insert().values(
+            first_name="Jane",
+            last_name="Smith",
+            email="jane@example.com",
+            birthday=_UPCOMING,
+            owner_id=user.id,
+        )
     )
-    crud.create_contact(db_session, contact, user)
+    db_session.commit()
 
     resp = client.get(
         "/contacts/birthdays/upcoming",
         headers={"Authorization": f"Bearer {token}"},
     )
     assert resp.status_code == status.HTTP_200_OK
-    data = resp.json()
-    assert any(item["email"] == "jane@example.com" for item in data)
+    emails = {item["email"] for item in resp.json()}
+    assert "jane@example.com" in emails